@@ -4,51 +4,69 @@ import argparse
 import json
 import sys
 from pathlib import Path
+from typing import Optional
 
 from check_circular_import import __version__
 from check_circular_import.detector import CircularImportDetector
 from check_circular_import.utils import format_cycle_output
 
 
+def render_json(report: dict) -> str:
+    """Render an analysis report as a JSON string."""
+    return json.dumps(report, indent=2)
+
+
+def render_text(report: dict) -> str:
+    """Render an analysis report as the human-readable text report."""
+    stats = report["statistics"]
+    cycles = report["cycles"]
+
+    lines = [
+        "",
+        "=" * 60,
+        "CIRCULAR IMPORT DETECTION REPORT",
+        "=" * 60,
+        "",
+        f"Project root: {report['root_directory']}",
+        "",
+        "Statistics:",
+        f"  - Total modules analyzed: {stats['total_modules']}",
+        f"  - Total dependencies: {stats['total_dependencies']}",
+        f"  - Modules with dependencies: {stats['modules_with_dependencies']}",
+        f"  - Circular dependencies found: {stats['circular_dependencies_found']}",
+    ]
+
+    if cycles:
+        lines.append(f"\n⚠️  Found {len(cycles)} circular import(s):\n")
+
+        for i, cycle in enumerate(cycles, 1):
+            lines.append(f"Cycle {i}:")
+            lines.append(format_cycle_output(cycle))
+            lines.append("")
+    else:
+        lines.append("\n✅ No circular imports detected!")
+
+    lines.append("=" * 60)
+    return "\n".join(lines)
+
+
 def print_report(
     cycles: list[list[str]], stats: dict, root_directory: Path, json_output: bool
 ) -> None:
     """Print a formatted report of the analysis."""
+    report = {
+        "root_directory": str(root_directory),
+        "statistics": stats,
+        "cycles": cycles,
+    }
+
     if json_output:
-        result = {
-            "root_directory": str(root_directory),
-            "statistics": stats,
-            "cycles": cycles,
-        }
-        print(json.dumps(result, indent=2))
+        print(render_json(report))
     else:
-        print("\n" + "=" * 60)
-        print("CIRCULAR IMPORT DETECTION REPORT")
-        print("=" * 60)
-
-        print(f"\nProject root: {root_directory}")
-        print("\nStatistics:")
-        print(f"  - Total modules analyzed: {stats['total_modules']}")
-        print(f"  - Total dependencies: {stats['total_dependencies']}")
-        print(f"  - Modules with dependencies: {stats['modules_with_dependencies']}")
-        print(
-            f"  - Circular dependencies found: {stats['circular_dependencies_found']}"
-        )
-
-        if cycles:
-            print(f"\n⚠️  Found {len(cycles)} circular import(s):\n")
-
-            for i, cycle in enumerate(cycles, 1):
-                print(f"Cycle {i}:")
-                print(format_cycle_output(cycle))
-                print()
-        else:
-            print("\n✅ No circular imports detected!")
+        print(render_text(report))
 
-        print("=" * 60)
 
-
-def main() -> int:
+def main(argv: Optional[list[str]] = None) -> int:
     """Main entry point for the CLI."""
     parser = argparse.ArgumentParser(
         description="Detect circular imports in Python projects",
@@ -82,6 +100,12 @@ Examples:
         help="Output results as JSON",
     )
 
+    parser.add_argument(
+        "--fast",
+        action="store_true",
+        help="Stop at the first circular import found (skips full statistics)",
+    )
+
     parser.add_argument(
         "--verbose",
         "-v",
@@ -96,7 +120,7 @@ Examples:
         help="Show version and exit",
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # Create detector and run analysis
     try:
@@ -106,6 +130,26 @@ Examples:
             print(f"Analyzing Python files in: {Path(args.directory).resolve()}")
             print(f"Ignoring directories: {', '.join(detector.ignore_dirs)}")
             print()
+
+        if args.fast:
+            # Early-exit mode: stop at the first cycle, skip statistics
+            detector.build_dependency_graph()
+            cycle = detector.find_first_cycle()
+
+            if args.json:
+                result = {
+                    "root_directory": str(detector.root_directory),
+                    "cycles": [cycle] if cycle else [],
+                }
+                print(json.dumps(result, indent=2))
+            elif cycle:
+                print("⚠️  Circular import found:\n")
+                print(format_cycle_output(cycle))
+            else:
+                print("✅ No circular imports detected!")
+
+            return 1 if cycle else 0
+
         cycles, stats = detector.analyze()
 
         print_report(cycles, stats, detector.root_directory, args.json)
@@ -1,18 +1,116 @@
 """Core circular import detection logic."""
 
 import ast
+import json
+import os
+import re
 import sys
+from array import array
 from collections import defaultdict
+from collections.abc import Generator, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from hashlib import blake2b
+from itertools import repeat
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
 from check_circular_import.utils import (
     DEFAULT_IGNORE_DIRS,
     file_to_module_name,
     get_python_files,
-    normalize_cycle,
 )
 
+# Pattern for the regex fallback used when a file cannot be parsed as
+# Python; compiled once, and both statement forms share one alternation
+# so a malformed file is scanned a single time
+_FALLBACK_IMPORT_RE = re.compile(
+    r"^\s*(?:import\s+(?P<mod>[A-Za-z0-9_\.]+)"
+    r"|from\s+(?P<base>[A-Za-z0-9_\.]+)\s+import\s+(?P<names>[^\n#]+))",
+    re.MULTILINE,
+)
+
+# In-process AST cache keyed by content hash: identical file contents
+# (empty __init__.py files, generated boilerplate) parse once. Bounded
+# crudely by clearing when full; hashing is an order of magnitude
+# cheaper than re-parsing even on a miss.
+_AST_CACHE: dict[bytes, ast.Module] = {}
+_AST_CACHE_MAX = 256
+
+
+def _parse_source(source: bytes, filename: str) -> ast.Module:
+    """Parse Python source bytes, memoized by content hash.
+
+    The returned tree is shared between identical files and must only
+    be read, which is all extract_imports does.
+    """
+    key = blake2b(source, digest_size=16).digest()
+    tree = _AST_CACHE.get(key)
+
+    if tree is None:
+        tree = ast.parse(source, filename=filename, type_comments=False)
+        if len(_AST_CACHE) >= _AST_CACHE_MAX:
+            _AST_CACHE.clear()
+        _AST_CACHE[key] = tree
+
+    return tree
+
+
+# On-disk cache of per-file import sets, stored in the analyzed root.
+# Pre-commit re-scans the same tree many times; unchanged files (same
+# mtime and size) skip ast.parse entirely on later runs.
+CACHE_FILE_NAME = ".check_circular_import_cache"
+
+# Bumped whenever the cache layout or extraction semantics change, so
+# stale caches from older releases are discarded rather than trusted.
+_CACHE_VERSION = 1
+
+# Minimum number of files before parsing is sharded across a process
+# pool; below this the pool startup cost outweighs the parallel parse.
+_PARALLEL_MIN_FILES = 64
+
+# Number of files handed to each worker task.
+_PARALLEL_BATCH_SIZE = 64
+
+# Node types whose children can contain import statements. Imports are
+# statements, so expression subtrees never need to be visited.
+if sys.version_info >= (3, 10):
+    _BLOCK_NODE_TYPES: tuple[type, ...] = (ast.stmt, ast.ExceptHandler, ast.match_case)
+else:
+    _BLOCK_NODE_TYPES = (ast.stmt, ast.ExceptHandler)
+
+
+def _walk_statements(tree: ast.Module) -> Generator[ast.stmt, None, None]:
+    """Yield every statement in the tree, skipping expression subtrees.
+
+    A targeted replacement for ``ast.walk``: import statements can only
+    appear in statement bodies, so descending into expressions (the bulk
+    of most trees) is wasted work.
+    """
+    stack: list[ast.AST] = list(tree.body)
+
+    while stack:
+        node = stack.pop()
+        if isinstance(node, ast.stmt):
+            yield node
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, _BLOCK_NODE_TYPES):
+                stack.append(child)
+
+
+def _read_file_text(file_path: Path) -> str:
+    """Default text reader for the regex fallback."""
+    return file_path.read_text(encoding="utf-8")
+
+
+def _extract_imports_batch(files: list[Path], root_directory: Path) -> list[set[str]]:
+    """Process-pool worker: extract imports for a batch of files.
+
+    Top-level so it pickles; only the paths and the root travel to the
+    worker, not the detector instance.
+    """
+    detector = CircularImportDetector(str(root_directory))
+    return [detector.extract_imports(file_path) for file_path in files]
+
 
 class CircularImportDetector:
     """Detector for circular import dependencies in Python projects."""
@@ -26,23 +124,113 @@ class CircularImportDetector:
             ignore_dirs: List of directory names to ignore
         """
         self.root_directory = Path(root_directory).resolve()
-        if ignore_dirs is None:
-            self.ignore_dirs = list(DEFAULT_IGNORE_DIRS)
-        else:
-            # Combine default and custom ignore directories
-            self.ignore_dirs = list({*DEFAULT_IGNORE_DIRS, *ignore_dirs})
+        # Combine default and custom ignore directories, deduplicating
+        # while preserving order so e.g. --verbose output is deterministic
+        combined = list(DEFAULT_IGNORE_DIRS) + list(ignore_dirs or [])
+        self.ignore_dirs = list(dict.fromkeys(combined))
         self.dependency_graph: dict[str, set[str]] = defaultdict(set)
         self.module_to_file: dict[str, Path] = {}
+        self._top_packages: set[str] = set()
+        self._resolve: dict[str, Optional[str]] = {}
+        self._cache_path = self.root_directory / CACHE_FILE_NAME
+        self._cache: dict[str, dict] = self._load_cache()
+
+    def _load_cache(self) -> dict[str, dict]:
+        """Load the on-disk import cache, discarding stale or invalid data."""
+        try:
+            with open(self._cache_path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+        if not isinstance(data, dict) or data.get("version") != _CACHE_VERSION:
+            return {}
+
+        files = data.get("files")
+        return files if isinstance(files, dict) else {}
+
+    def _save_cache(self) -> None:
+        """Persist the import cache next to the analyzed tree; best-effort."""
+        try:
+            with open(self._cache_path, "w", encoding="utf-8") as f:
+                json.dump({"version": _CACHE_VERSION, "files": self._cache}, f)
+        except OSError:
+            pass
+
+    def _cached_imports(self, file_path: Path) -> Optional[set[str]]:
+        """Return the cached import set if the file's mtime and size match."""
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return None
+
+        entry = self._cache.get(str(file_path))
+        if (
+            entry is not None
+            and entry.get("mtime") == stat.st_mtime
+            and entry.get("size") == stat.st_size
+        ):
+            # A cache entry that parses but has the wrong shape must read
+            # as a miss, never fail the run
+            imports = entry.get("imports")
+            if isinstance(imports, list) and all(
+                isinstance(name, str) for name in imports
+            ):
+                return {sys.intern(name) for name in imports}
+
+        return None
+
+    def _store_imports(self, file_path: Path, imports: set[str]) -> None:
+        """Record a file's import set in the cache keyed by mtime and size."""
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return
+
+        self._cache[str(file_path)] = {
+            "mtime": stat.st_mtime,
+            "size": stat.st_size,
+            "imports": sorted(imports),
+        }
+
+    def extract_imports(
+        self,
+        file_path: Path,
+        read_text: Optional[Callable[[Path], str]] = None,
+    ) -> set[str]:
+        """
+        Extract all imports from a Python file.
+
+        Args:
+            file_path: Path to the Python file
+            read_text: Optional replacement for the text read used by the
+                regex fallback, injectable for testing
+        """
+        cached = self._cached_imports(file_path)
+        if cached is not None:
+            return cached
+
+        imports: set[str] = set()
 
-    def extract_imports(self, file_path: Path) -> set[str]:
-        """Extract all imports from a Python file."""
-        imports = set()
+        # Computed once per file; every relative import below needs it
+        current_module = file_to_module_name(file_path, self.root_directory)
+        current_parts = current_module.split(".") if current_module else []
 
         try:
-            with open(file_path, encoding="utf-8") as f:
-                tree = ast.parse(f.read(), filename=str(file_path))
+            source = file_path.read_bytes()
 
-            for node in ast.walk(tree):
+            # Fast path: a file whose bytes never contain "import" cannot
+            # have any import statement, so skip parsing it entirely
+            if b"import" not in source:
+                self._store_imports(file_path, imports)
+                return imports
+
+            # Feed bytes straight to the parser: it decodes internally
+            # (honoring coding declarations), so pre-decoding to str would
+            # just add a full pass over every file
+            tree = _parse_source(source, str(file_path))
+
+            for node in _walk_statements(tree):
                 if isinstance(node, ast.Import):
                     for alias in node.names:
                         imports.add(alias.name)
@@ -50,11 +238,6 @@ class CircularImportDetector:
                 elif isinstance(node, ast.ImportFrom):
                     if node.level > 0:
                         # This is a relative import
-                        current_module = file_to_module_name(
-                            file_path, self.root_directory
-                        )
-                        current_parts = current_module.split(".")
-
                         if node.level <= len(current_parts):
                             base_parts = (
                                 current_parts[: -node.level]
@@ -68,54 +251,44 @@ class CircularImportDetector:
                             if full_module:
                                 imports.add(full_module)
 
-                            # Also add specific imports from relative imports
+                            # Also add specific imports from relative
+                            # imports; build the dotted prefix once rather
+                            # than formatting per alias
+                            dot_prefix = full_module + "." if full_module else ""
                             for alias in node.names:
                                 if alias.name != "*":
-                                    if node.module:
-                                        specific_module = (
-                                            f"{full_module}.{alias.name}"
-                                            if full_module
-                                            else alias.name
-                                        )
-                                    else:
-                                        specific_module = ".".join(
-                                            base_parts + [alias.name]
-                                        )
-                                    if specific_module:
-                                        imports.add(specific_module)
+                                    imports.add(dot_prefix + alias.name)
                     elif node.module:
                         # Absolute import
                         imports.add(node.module)
 
                         # For "from X import Y", also consider X.Y as a potential module
+                        dot_prefix = node.module + "."
                         for alias in node.names:
                             if alias.name != "*":
-                                potential_module = f"{node.module}.{alias.name}"
-                                imports.add(potential_module)
+                                imports.add(dot_prefix + alias.name)
 
         except (SyntaxError, FileNotFoundError) as e:
             # Best-effort fallback: simple regex-based extraction when AST fails
             print(f"Warning: Could not parse {file_path}: {e}", file=sys.stderr)
+            if read_text is None:
+                read_text = _read_file_text
             try:
-                text = Path(file_path).read_text(encoding="utf-8")
+                text = read_text(file_path)
             except Exception:
                 return imports
 
-            import re
-
-            # Handle lines like: import a.b.c [as x]
-            for m in re.finditer(r"^\s*import\s+([A-Za-z0-9_\.]+)", text, re.MULTILINE):
-                imports.add(m.group(1))
+            # One scan handles both "import a.b.c [as x]" and
+            # "from a.b import c, d" lines
+            for m in _FALLBACK_IMPORT_RE.finditer(text):
+                mod = m.group("mod")
+                if mod:
+                    imports.add(mod)
+                    continue
 
-            # Handle lines like: from a.b import c, d
-            for m in re.finditer(
-                r"^\s*from\s+([A-Za-z0-9_\.]+)\s+import\s+([^\n#]+)",
-                text,
-                re.MULTILINE,
-            ):
-                base = m.group(1).strip()
+                base = m.group("base")
                 imports.add(base)
-                names = [part.strip() for part in m.group(2).split(",")]
+                names = [part.strip() for part in m.group("names").split(",")]
                 for name in names:
                     if not name or name == "*":
                         continue
@@ -123,83 +296,284 @@ class CircularImportDetector:
                     name = name.split(" as ", 1)[0].strip()
                     imports.add(f"{base}.{name}")
 
+        # Intern once at the end: module names recur across files as dict
+        # keys and set members, so duplicates collapse to shared storage
+        imports = {sys.intern(name) for name in imports}
+
+        self._store_imports(file_path, imports)
         return imports
 
     def build_dependency_graph(self) -> None:
         """Build the dependency graph from all Python files."""
         python_files = get_python_files(self.root_directory, self.ignore_dirs)
 
-        # First pass: map all modules to their files
+        # Single walk over the file list: map modules to files, keeping
+        # each file's module name so it isn't derived again below
+        module_names = []
         for file_path in python_files:
             module_name = file_to_module_name(file_path, self.root_directory)
+            module_names.append(module_name)
             if module_name:
                 self.module_to_file[module_name] = file_path
 
-        # Second pass: build dependency graph
-        for file_path in python_files:
-            module_name = file_to_module_name(file_path, self.root_directory)
+        # Top-level package names, used to cheaply reject external imports
+        self._top_packages = {module.split(".", 1)[0] for module in self.module_to_file}
+
+        # Seed the memoized resolution table with the known modules
+        self._resolve = {module: module for module in self.module_to_file}
+
+        # Imports can only be classified once the module map is complete
+        imports_per_file = self._extract_all_imports(python_files)
+
+        for module_name, imports in zip(module_names, imports_per_file):
             if not module_name:
                 continue
-            imports = self.extract_imports(file_path)
 
             for imported_module in imports:
                 # Only track internal project imports
                 if self.is_internal_import(imported_module):
                     self.dependency_graph[module_name].add(imported_module)
 
+        self._save_cache()
+
+    def _extract_all_imports(self, python_files: list[Path]) -> list[set[str]]:
+        """
+        Extract imports for each file, in file order.
+
+        Parsing is CPU-bound and per-file independent, so large file sets
+        are sharded across a process pool; small ones stay serial to
+        avoid pool startup overhead.
+        """
+        if len(python_files) < _PARALLEL_MIN_FILES:
+            return [self.extract_imports(file_path) for file_path in python_files]
+
+        # Resolve cache hits up front so only changed files hit the pool
+        imports_per_file: dict[int, set[str]] = {}
+        miss_indices = []
+        for i, file_path in enumerate(python_files):
+            cached = self._cached_imports(file_path)
+            if cached is not None:
+                imports_per_file[i] = cached
+            else:
+                miss_indices.append(i)
+
+        miss_files = [python_files[i] for i in miss_indices]
+        if len(miss_files) < _PARALLEL_MIN_FILES:
+            for i, file_path in zip(miss_indices, miss_files):
+                imports_per_file[i] = self.extract_imports(file_path)
+        else:
+            batches = [
+                miss_files[i : i + _PARALLEL_BATCH_SIZE]
+                for i in range(0, len(miss_files), _PARALLEL_BATCH_SIZE)
+            ]
+            max_workers = min(os.cpu_count() or 1, len(miss_files) // 32 + 1)
+
+            extracted: list[set[str]] = []
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                for batch_imports in executor.map(
+                    _extract_imports_batch, batches, repeat(self.root_directory)
+                ):
+                    extracted.extend(batch_imports)
+
+            for i, file_path, imports in zip(miss_indices, miss_files, extracted):
+                imports_per_file[i] = imports
+                self._store_imports(file_path, imports)
+
+        return [imports_per_file[i] for i in range(len(python_files))]
+
     def is_internal_import(self, module_name: str) -> bool:
         """Check if an import is internal to the project."""
-        # Check if the module or any parent module exists in our project
-        parts = module_name.split(".")
+        return self._resolve_import(module_name) is not None
 
-        for i in range(len(parts), 0, -1):
-            potential_module = ".".join(parts[:i])
-            if potential_module in self.module_to_file:
-                return True
+    def _resolve_import(self, module_name: str) -> Optional[str]:
+        """
+        Resolve an imported name to its longest internal prefix module.
 
-        return False
+        Results — including external misses — are memoized in
+        self._resolve, so an import repeated across many files is
+        resolved with a single dict lookup after the first time.
+        """
+        try:
+            return self._resolve[module_name]
+        except KeyError:
+            pass
+
+        hit = None
+        # Fast reject: most imports are external, and an internal module's
+        # top-level package is always in the project
+        if module_name.split(".", 1)[0] in self._top_packages:
+            parts = module_name.split(".")
+            # The full name missed the table above, so start one prefix up
+            for i in range(len(parts) - 1, 0, -1):
+                potential_module = ".".join(parts[:i])
+                if potential_module in self.module_to_file:
+                    hit = potential_module
+                    break
+
+        self._resolve[module_name] = hit
+        return hit
+
+    def _build_csr(self) -> tuple[list[str], "array[int]", "array[int]"]:
+        """
+        Flatten the dependency graph into CSR (compressed sparse row) form.
 
-    def find_cycles(self) -> list[list[str]]:
-        """Find all cycles in the dependency graph using DFS."""
-        cycles = []
-        visited = set()
-        rec_stack: list[str] = []
+        Module names are interned to dense integer ids so the DFS can
+        iterate neighbors as contiguous int slices instead of hashing
+        strings on every edge.
 
-        def dfs(module: str) -> None:
-            if module in rec_stack:
-                # Found a cycle
-                cycle_start = rec_stack.index(module)
-                cycle = rec_stack[cycle_start:] + [module]
-                cycles.append(cycle)
-                return
+        Returns:
+            A tuple of (id_to_name, indptr, indices) where the neighbors
+            of node v are indices[indptr[v]:indptr[v + 1]].
+        """
+        name_to_id: dict[str, int] = {}
+        id_to_name: list[str] = []
 
-            if module in visited:
-                return
+        for module in self.dependency_graph:
+            if module not in name_to_id:
+                name_to_id[module] = len(id_to_name)
+                id_to_name.append(module)
+        for neighbors in self.dependency_graph.values():
+            for neighbor in neighbors:
+                if neighbor not in name_to_id:
+                    name_to_id[neighbor] = len(id_to_name)
+                    id_to_name.append(neighbor)
+
+        indptr = array("i", [0])
+        indices = array("i")
+        for module in id_to_name:
+            for neighbor in self.dependency_graph.get(module, ()):
+                indices.append(name_to_id[neighbor])
+            indptr.append(len(indices))
+
+        return id_to_name, indptr, indices
+
+    def find_sccs(self) -> Iterator[list[str]]:
+        """
+        Find strongly connected components using Tarjan's algorithm.
 
-            visited.add(module)
-            rec_stack.append(module)
+        Runs a single iterative DFS over the CSR adjacency in O(V + E)
+        time, yielding each component (in DFS discovery order) as soon
+        as it closes, so callers can consume them without materializing
+        every component at once.
+        """
+        id_to_name, indptr, indices = self._build_csr()
+        node_count = len(id_to_name)
 
-            for neighbor in self.dependency_graph.get(module, []):
-                dfs(neighbor)
+        index_of = array("i", [-1]) * node_count
+        lowlink = array("i", [-1]) * node_count
+        on_stack = bytearray(node_count)
+        scc_stack: list[int] = []
+        counter = 0
 
-            rec_stack.pop()
+        for start in range(node_count):
+            if index_of[start] != -1:
+                continue
 
-        # Start DFS from each unvisited node
-        for module in self.dependency_graph:
-            if module not in visited:
-                dfs(module)
+            index_of[start] = lowlink[start] = counter
+            counter += 1
+            scc_stack.append(start)
+            on_stack[start] = 1
+            # Each frame is (node, cursor into its CSR edge slice)
+            work = [(start, indptr[start])]
+
+            while work:
+                node, edge = work[-1]
+
+                if edge < indptr[node + 1]:
+                    work[-1] = (node, edge + 1)
+                    neighbor = indices[edge]
+                    if index_of[neighbor] == -1:
+                        index_of[neighbor] = lowlink[neighbor] = counter
+                        counter += 1
+                        scc_stack.append(neighbor)
+                        on_stack[neighbor] = 1
+                        work.append((neighbor, indptr[neighbor]))
+                    elif on_stack[neighbor]:
+                        lowlink[node] = min(lowlink[node], index_of[neighbor])
+                else:
+                    # All neighbors explored; close out this node
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        lowlink[parent] = min(lowlink[parent], lowlink[node])
+                    if lowlink[node] == index_of[node]:
+                        # Node is the root of an SCC; pop its members
+                        component = []
+                        while True:
+                            member = scc_stack.pop()
+                            on_stack[member] = 0
+                            component.append(id_to_name[member])
+                            if member == node:
+                                break
+                        component.reverse()
+                        yield component
+
+    def find_first_cycle(self) -> Optional[list[str]]:
+        """
+        Find one circular dependency, or None if the graph is acyclic.
+
+        Iterative white/grey/black DFS that stops at the first back edge,
+        for callers that only need the exit status. The returned cycle
+        lists each member once, in import order, matching the shape of
+        find_cycles output.
+        """
+        white, grey, black = 0, 1, 2
+        color: dict[str, int] = {}
+        parent: dict[str, str] = {}
+
+        for start in self.dependency_graph:
+            if color.get(start, white) != white:
+                continue
 
-        # Remove duplicate cycles
-        unique_cycles = []
-        seen = set()
+            color[start] = grey
+            work = [(start, iter(self.dependency_graph.get(start, ())))]
+
+            while work:
+                module, neighbors = work[-1]
+                neighbor = next(neighbors, None)
+
+                if neighbor is None:
+                    work.pop()
+                    color[module] = black
+                    continue
+
+                state = color.get(neighbor, white)
+                if state == grey:
+                    # Back edge: walk parent links back to close the cycle
+                    cycle = [module]
+                    node = module
+                    while node != neighbor:
+                        node = parent[node]
+                        cycle.append(node)
+                    cycle.reverse()
+                    return cycle
+                if state == white:
+                    color[neighbor] = grey
+                    parent[neighbor] = module
+                    work.append(
+                        (neighbor, iter(self.dependency_graph.get(neighbor, ())))
+                    )
+
+        return None
+
+    def iter_cycles(self) -> Iterator[list[str]]:
+        """
+        Yield circular dependencies in the graph as they are discovered.
 
-        for cycle in cycles:
-            normalized = normalize_cycle(cycle)
-            if normalized not in seen:
-                seen.add(normalized)
-                unique_cycles.append(list(normalized))
+        Each strongly connected component of size >= 2 (or a single module
+        that imports itself) is a circular-import group; its members are
+        yielded as one cycle in DFS discovery order. SCCs are inherently
+        unique, so no deduplication or normalization pass is needed.
+        """
+        for component in self.find_sccs():
+            if len(component) > 1 or component[0] in self.dependency_graph.get(
+                component[0], ()
+            ):
+                yield component
 
-        return unique_cycles
+    def find_cycles(self) -> list[list[str]]:
+        """Find all circular dependencies in the graph as a list."""
+        return list(self.iter_cycles())
 
     def analyze(self) -> tuple[list[list[str]], dict]:
         """
@@ -212,6 +586,7 @@ class CircularImportDetector:
         # Reset state in case of reuse
         self.dependency_graph.clear()
         self.module_to_file.clear()
+        file_to_module_name.cache_clear()
 
         self.build_dependency_graph()
         cycles = self.find_cycles()
@@ -1,7 +1,10 @@
 """Utility functions for circular import detection."""
 
 import os
+import sys
+from collections.abc import Iterator
 from fnmatch import fnmatch
+from functools import lru_cache
 from pathlib import Path
 
 # Centralized default ignore patterns for directories
@@ -19,6 +22,45 @@ DEFAULT_IGNORE_DIRS: list[str] = [
 ]
 
 
+def _iter_python_files(
+    path: Path, exact_ignores: frozenset, wildcard_ignores: list[str]
+) -> Iterator[Path]:
+    """
+    Yield Python files under a directory, pruning ignored subdirectories.
+
+    Uses os.scandir directly so directory/file checks come from the
+    cached dirent data instead of extra stat calls. Hidden directories
+    (leading dot) are always pruned — they can never hold importable
+    modules. Traversal keeps an explicit stack of pending directories,
+    so arbitrarily deep trees cannot hit the recursion limit.
+
+    Args:
+        path: Directory to scan
+        exact_ignores: Literal directory names to ignore
+        wildcard_ignores: fnmatch patterns of directories to ignore
+    """
+    pending = [path]
+
+    while pending:
+        directory = pending.pop()
+        try:
+            entries = os.scandir(directory)
+        except OSError:
+            continue
+
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    name = entry.name
+                    if name.startswith(".") or name in exact_ignores:
+                        continue
+                    if any(fnmatch(name, pattern) for pattern in wildcard_ignores):
+                        continue
+                    pending.append(Path(entry.path))
+                elif entry.name.endswith(".py") and entry.is_file():
+                    yield Path(entry.path)
+
+
 def get_python_files(root_directory: Path, ignore_dirs: list[str]) -> list[Path]:
     """
     Find all Python files in the project directory.
@@ -30,26 +72,24 @@ def get_python_files(root_directory: Path, ignore_dirs: list[str]) -> list[Path]
     Returns:
         List of Path objects for Python files
     """
-    python_files = []
-
-    for root, dirs, files in os.walk(root_directory):
-        # Remove ignored directories from dirs to prevent walking into them
-        # Support wildcard patterns like "*.egg-info"
-        dirs[:] = [
-            d for d in dirs if not any(fnmatch(d, pattern) for pattern in ignore_dirs)
-        ]
-
-        for file in files:
-            if file.endswith(".py"):
-                python_files.append(Path(root) / file)
+    # Most ignore entries are literal names; check those with a set
+    # lookup and reserve fnmatch for patterns that actually use wildcards
+    wildcard_ignores = [p for p in ignore_dirs if any(c in p for c in "*?[")]
+    exact_ignores = frozenset(ignore_dirs) - set(wildcard_ignores)
 
-    return python_files
+    return list(_iter_python_files(root_directory, exact_ignores, wildcard_ignores))
 
 
+@lru_cache(maxsize=4096)
 def file_to_module_name(file_path: Path, root_directory: Path) -> str:
     """
     Convert a file path to a module name.
 
+    Memoized: the detector asks for the same file's name from several
+    places (graph building, relative-import handling), and the mapping
+    is a pure function of the two paths. Callers that rescan should
+    clear via ``file_to_module_name.cache_clear()`` to bound memory.
+
     Args:
         file_path: Path to the Python file
         root_directory: Root directory of the project
@@ -69,7 +109,9 @@ def file_to_module_name(file_path: Path, root_directory: Path) -> str:
             module_parts = module_parts[:-1]
 
         # If this is root-level __init__.py, ignore by returning empty name
-        return ".".join(module_parts) if module_parts else ""
+        # Interned: module names are reused as dict keys and set members
+        # all over the dependency graph
+        return sys.intern(".".join(module_parts)) if module_parts else ""
     except ValueError:
         return str(file_path)
 
@@ -84,6 +126,13 @@ def normalize_cycle(cycle: list[str]) -> tuple[str, ...]:
     Returns:
         Normalized tuple of module names
     """
+    # Thin wrapper converting to a hashable tuple for memoization
+    return _normalize_cycle_cached(tuple(cycle))
+
+
+@lru_cache(maxsize=4096)
+def _normalize_cycle_cached(cycle: tuple[str, ...]) -> tuple[str, ...]:
+    """Memoized implementation of normalize_cycle."""
     if len(cycle) > 1:
         # Remove the duplicate last element if present
         if cycle[0] == cycle[-1]:
@@ -6,19 +6,35 @@ from pathlib import Path
 
 import pytest
 
+from tests.test_utils import analyze_project, fast_tmp_root
+
 
 @pytest.fixture
 def temp_project_dir() -> Generator[Path, None, None]:
-    """Create a temporary directory for test projects."""
-    with tempfile.TemporaryDirectory() as tmpdir:
+    """Create a temporary directory for test projects.
+
+    Rooted on tmpfs (/dev/shm) when available so per-test file setup
+    stays in RAM; see fast_tmp_root.
+    """
+    with tempfile.TemporaryDirectory(dir=fast_tmp_root()) as tmpdir:
         yield Path(tmpdir)
 
 
-@pytest.fixture
-def project_with_circular_imports(temp_project_dir: Path) -> Path:
+# The project fixtures below are never mutated by tests, so they are
+# built (and analyzed, via the analyzed_* companions) once per session
+# instead of once per test. A test that needs a mutable copy of one
+# should clone it into its own tmp_path with
+# shutil.copytree(src, dst, copy_function=os.link) rather than demoting
+# the fixture to function scope.
+
+
+@pytest.fixture(scope="session")
+def project_with_circular_imports(tmp_path_factory: pytest.TempPathFactory) -> Path:
     """Create a test project with circular imports."""
+    project_dir = tmp_path_factory.mktemp("circular_project")
+
     # Create module_a.py that imports module_b
-    module_a = temp_project_dir / "module_a.py"
+    module_a = project_dir / "module_a.py"
     module_a.write_text(
         """
 import module_b
@@ -29,7 +45,7 @@ def func_a():
     )
 
     # Create module_b.py that imports module_a (circular!)
-    module_b = temp_project_dir / "module_b.py"
+    module_b = project_dir / "module_b.py"
     module_b.write_text(
         """
 import module_a
@@ -39,14 +55,18 @@ def func_b():
 """
     )
 
-    return temp_project_dir
+    return project_dir
 
 
-@pytest.fixture
-def project_with_nested_circular_imports(temp_project_dir: Path) -> Path:
+@pytest.fixture(scope="session")
+def project_with_nested_circular_imports(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Path:
     """Create a test project with nested circular imports."""
+    project_dir = tmp_path_factory.mktemp("nested_circular_project")
+
     # Create package structure
-    pkg_dir = temp_project_dir / "mypackage"
+    pkg_dir = project_dir / "mypackage"
     pkg_dir.mkdir()
 
     # Create __init__.py
@@ -82,14 +102,16 @@ def func_c():
 """
     )
 
-    return temp_project_dir
+    return project_dir
 
 
-@pytest.fixture
-def clean_project(temp_project_dir: Path) -> Path:
+@pytest.fixture(scope="session")
+def clean_project(tmp_path_factory: pytest.TempPathFactory) -> Path:
     """Create a test project without circular imports."""
+    project_dir = tmp_path_factory.mktemp("clean_project")
+
     # Create utils.py
-    utils = temp_project_dir / "utils.py"
+    utils = project_dir / "utils.py"
     utils.write_text(
         """
 def helper():
@@ -98,7 +120,7 @@ def helper():
     )
 
     # Create main.py that imports utils
-    main = temp_project_dir / "main.py"
+    main = project_dir / "main.py"
     main.write_text(
         """
 import utils
@@ -109,7 +131,7 @@ def main():
     )
 
     # Create app.py that imports both
-    app = temp_project_dir / "app.py"
+    app = project_dir / "app.py"
     app.write_text(
         """
 import main
@@ -120,14 +142,18 @@ def run():
 """
     )
 
-    return temp_project_dir
+    return project_dir
 
 
-@pytest.fixture
-def project_with_relative_imports(temp_project_dir: Path) -> Path:
+@pytest.fixture(scope="session")
+def project_with_relative_imports(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Path:
     """Create a test project with relative imports causing circular dependencies."""
+    project_dir = tmp_path_factory.mktemp("relative_imports_project")
+
     # Create package structure
-    pkg_dir = temp_project_dir / "myapp"
+    pkg_dir = project_dir / "myapp"
     pkg_dir.mkdir()
 
     # Create __init__.py
@@ -153,4 +179,36 @@ class View:
 """
     )
 
-    return temp_project_dir
+    return project_dir
+
+
+@pytest.fixture(scope="session")
+def analyzed_project_with_circular_imports(
+    project_with_circular_imports: Path,
+) -> tuple[list[list[str]], dict]:
+    """Analysis result for the circular-import project, computed once."""
+    return analyze_project(project_with_circular_imports)
+
+
+@pytest.fixture(scope="session")
+def analyzed_project_with_nested_circular_imports(
+    project_with_nested_circular_imports: Path,
+) -> tuple[list[list[str]], dict]:
+    """Analysis result for the nested circular-import project, computed once."""
+    return analyze_project(project_with_nested_circular_imports)
+
+
+@pytest.fixture(scope="session")
+def analyzed_clean_project(
+    clean_project: Path,
+) -> tuple[list[list[str]], dict]:
+    """Analysis result for the clean project, computed once."""
+    return analyze_project(clean_project)
+
+
+@pytest.fixture(scope="session")
+def analyzed_project_with_relative_imports(
+    project_with_relative_imports: Path,
+) -> tuple[list[list[str]], dict]:
+    """Analysis result for the relative-import project, computed once."""
+    return analyze_project(project_with_relative_imports)
@@ -2,8 +2,10 @@
 
 from pathlib import Path
 
+import check_circular_import.detector as detector_module
 from check_circular_import.detector import CircularImportDetector
 from check_circular_import.utils import file_to_module_name, normalize_cycle
+from tests.test_utils import create_module_files
 
 
 def test_regex_fallback_parses_imports_when_ast_fails(
@@ -39,24 +41,20 @@ from pkg.mod import a, b as bee, *
     assert not any(s.endswith(".*") for s in imports)
 
 
-def test_fallback_read_text_failure(monkeypatch, temp_project_dir: Path) -> None:
+def test_fallback_read_text_failure(temp_project_dir: Path) -> None:
     """If reading text fails during fallback, extractor returns safely (empty set)."""
+    # Must contain "import" to get past the no-import fast path, and be
+    # unparseable so the regex fallback (and thus the reader) is reached
     bad = temp_project_dir / "bad2.py"
-    bad.write_text("not valid python")
+    bad.write_text("import (bad")
 
     det = CircularImportDetector(str(temp_project_dir))
 
-    # Monkeypatch Path.read_text to raise for this file
-    original_read_text = Path.read_text
+    # Inject a reader that raises instead of mutating Path globally
+    def boom(path: Path) -> str:
+        raise RuntimeError("boom")
 
-    def boom(self, *args, **kwargs):  # type: ignore[override]
-        if self == bad:
-            raise RuntimeError("boom")
-        return original_read_text(self, *args, **kwargs)
-
-    monkeypatch.setattr(Path, "read_text", boom)
-
-    imports = det.extract_imports(bad)
+    imports = det.extract_imports(bad, read_text=boom)
     assert imports == set()
 
 
@@ -86,6 +84,88 @@ def test_file_to_module_name_nonrelative_returns_path(temp_project_dir: Path) ->
     assert mod == str(a)
 
 
+def test_malformed_cache_entry_is_a_miss(temp_project_dir: Path) -> None:
+    """A cache entry with the wrong shape must trigger a rescan, not a crash."""
+    import json
+
+    from check_circular_import.detector import CACHE_FILE_NAME
+
+    mod = temp_project_dir / "mod.py"
+    mod.write_text("import os")
+    stat = mod.stat()
+
+    # Matching mtime/size but no usable "imports" value
+    cache = {
+        "version": detector_module._CACHE_VERSION,
+        "files": {
+            str(mod): {"mtime": stat.st_mtime, "size": stat.st_size},
+        },
+    }
+    (temp_project_dir / CACHE_FILE_NAME).write_text(json.dumps(cache))
+
+    det = CircularImportDetector(str(temp_project_dir))
+    assert det.extract_imports(mod) == {"os"}
+
+
+def test_parallel_extraction_matches_serial(
+    temp_project_dir: Path, monkeypatch
+) -> None:
+    """The process-pool extraction path must agree with the serial path.
+
+    70 files crosses _PARALLEL_MIN_FILES, so the first run exercises the
+    batching and miss-index stitching for real; the serial baseline is
+    forced by raising the threshold out of reach.
+    """
+    modules = {f"mod_{i:03d}": f"import mod_{(i + 1) % 70:03d}" for i in range(70)}
+
+    parallel_dir = temp_project_dir / "parallel"
+    serial_dir = temp_project_dir / "serial"
+    parallel_dir.mkdir()
+    serial_dir.mkdir()
+    create_module_files(parallel_dir, modules)
+    create_module_files(serial_dir, modules)
+
+    det_parallel = CircularImportDetector(str(parallel_dir))
+    parallel_cycles, parallel_stats = det_parallel.analyze()
+
+    monkeypatch.setattr(detector_module, "_PARALLEL_MIN_FILES", 10**9)
+    det_serial = CircularImportDetector(str(serial_dir))
+    serial_cycles, serial_stats = det_serial.analyze()
+
+    assert sorted(map(sorted, parallel_cycles)) == sorted(map(sorted, serial_cycles))
+    assert parallel_stats == serial_stats
+    assert det_parallel.dependency_graph == det_serial.dependency_graph
+
+
+def test_parallel_extraction_with_cache_hits(temp_project_dir: Path) -> None:
+    """Mixed cache hits and misses stitch back to the right files."""
+    modules = {f"mod_{i:03d}": f"import mod_{(i + 1) % 70:03d}" for i in range(70)}
+    create_module_files(temp_project_dir, modules)
+
+    first_cycles, _ = CircularImportDetector(str(temp_project_dir)).analyze()
+
+    # Second scan sees 70 cache hits plus 70 fresh misses, so the pool
+    # runs again with the prefilter active
+    extra = {f"extra_{i:02d}": "import mod_000" for i in range(70)}
+    create_module_files(temp_project_dir, extra)
+
+    det = CircularImportDetector(str(temp_project_dir))
+    mixed_cycles, mixed_stats = det.analyze()
+
+    assert mixed_stats["total_modules"] == 140
+    assert det.dependency_graph["extra_00"] == {"mod_000"}
+    assert sorted(map(sorted, mixed_cycles)) == sorted(map(sorted, first_cycles))
+
+    # A single new file leaves the residual misses under the threshold,
+    # so they are extracted serially against the cached majority
+    create_module_files(temp_project_dir, {"late_addition": "import mod_001"})
+    det_late = CircularImportDetector(str(temp_project_dir))
+    _, late_stats = det_late.analyze()
+
+    assert late_stats["total_modules"] == 141
+    assert det_late.dependency_graph["late_addition"] == {"mod_001"}
+
+
 def test_normalize_cycle_single_and_rotation() -> None:
     """Normalize handles single-item cycles and de-duplicates trailing element."""
     # Single element
@@ -1,13 +1,39 @@
 """Tests for the CLI interface."""
 
+import contextlib
+import io
 import json
 import subprocess
 import sys
 from pathlib import Path
 
+import pytest
+
+from check_circular_import.__main__ import main
+
+
+@pytest.fixture(scope="module")
+def cli_outputs_for_circular(project_with_circular_imports: Path) -> dict:
+    """Text and JSON CLI runs against the circular project, invoked once.
+
+    Several tests assert on the same invocation with and without --json;
+    sharing the outputs avoids re-analyzing the fixture tree per test.
+    """
+    outputs = {}
+
+    for key, extra_args in (("text", []), ("json", ["--json"])):
+        buffer = io.StringIO()
+        with contextlib.redirect_stdout(buffer):
+            exit_code = main([str(project_with_circular_imports), *extra_args])
+        outputs[key] = {"exit_code": exit_code, "stdout": buffer.getvalue()}
+
+    return outputs
+
 
 def test_cli_help():
-    """Test that --help works."""
+    """Test that --help works via the real `python -m` entry point."""
+    # Kept as the one subprocess-based smoke test; everything else runs
+    # in-process to skip interpreter startup per case
     result = subprocess.run(
         [sys.executable, "-m", "check_circular_import", "--help"],
         capture_output=True,
@@ -20,79 +46,53 @@ def test_cli_help():
     assert "--ignore" in result.stdout
 
 
-def test_cli_version():
+def test_cli_version(capsys):
     """Test that --version works and matches package version."""
     from check_circular_import import __version__
 
-    result = subprocess.run(
-        [sys.executable, "-m", "check_circular_import", "--version"],
-        capture_output=True,
-        text=True,
-    )
+    with pytest.raises(SystemExit) as exc_info:
+        main(["--version"])
 
-    assert result.returncode == 0
-    assert __version__ in result.stdout
+    assert exc_info.value.code == 0
+    assert __version__ in capsys.readouterr().out
 
 
-def test_cli_with_circular_imports(project_with_circular_imports: Path):
+def test_cli_with_circular_imports(cli_outputs_for_circular: dict):
     """Test CLI with a project containing circular imports."""
-    result = subprocess.run(
-        [
-            sys.executable,
-            "-m",
-            "check_circular_import",
-            str(project_with_circular_imports),
-        ],
-        capture_output=True,
-        text=True,
-    )
+    result = cli_outputs_for_circular["text"]
 
     # Should exit with code 1 when cycles are found
-    assert result.returncode == 1
-    assert "circular import" in result.stdout.lower()
-    assert "module_a" in result.stdout
-    assert "module_b" in result.stdout
+    assert result["exit_code"] == 1
+    assert "circular import" in result["stdout"].lower()
+    assert "module_a" in result["stdout"]
+    assert "module_b" in result["stdout"]
 
 
-def test_cli_with_clean_project(clean_project: Path):
+def test_cli_with_clean_project(capsys, clean_project: Path):
     """Test CLI with a clean project."""
-    result = subprocess.run(
-        [sys.executable, "-m", "check_circular_import", str(clean_project)],
-        capture_output=True,
-        text=True,
-    )
+    exit_code = main([str(clean_project)])
 
     # Should exit with code 0 when no cycles are found
-    assert result.returncode == 0
-    assert "No circular imports detected" in result.stdout
+    assert exit_code == 0
+    assert "No circular imports detected" in capsys.readouterr().out
 
 
-def test_cli_json_output(project_with_circular_imports: Path):
+def test_cli_json_output(cli_outputs_for_circular: dict):
     """Test CLI JSON output format."""
-    result = subprocess.run(
-        [
-            sys.executable,
-            "-m",
-            "check_circular_import",
-            str(project_with_circular_imports),
-            "--json",
-        ],
-        capture_output=True,
-        text=True,
-    )
+    result = cli_outputs_for_circular["json"]
 
     # Should still exit with code 1
-    assert result.returncode == 1
+    assert result["exit_code"] == 1
 
     # Parse JSON output
-    data = json.loads(result.stdout)
+    data = json.loads(result["stdout"])
     assert "root_directory" in data
     assert "statistics" in data
     assert "cycles" in data
     assert len(data["cycles"]) > 0
 
 
-def test_cli_ignore_directories(temp_project_dir: Path):
+def test_cli_ignore_directories(capsys, temp_project_dir: Path):
     """Test CLI --ignore option."""
     # Create a module in a directory that should be ignored
     ignored_dir = temp_project_dir / "ignored"
@@ -102,65 +102,118 @@ def test_cli_ignore_directories(temp_project_dir: Path):
     # Create a regular module
     (temp_project_dir / "regular.py").write_text("import os")
 
-    result = subprocess.run(
-        [
-            sys.executable,
-            "-m",
-            "check_circular_import",
-            str(temp_project_dir),
-            "--ignore",
-            "ignored",
-        ],
-        capture_output=True,
-        text=True,
-    )
+    exit_code = main([str(temp_project_dir), "--ignore", "ignored"])
 
-    assert result.returncode == 0
+    assert exit_code == 0
     # The ignored directory should not be analyzed
-    assert "ignored" not in result.stdout
+    assert "ignored" not in capsys.readouterr().out
 
 
-def test_cli_verbose_mode(clean_project: Path):
+def test_cli_verbose_mode(capsys, clean_project: Path):
     """Test CLI verbose mode."""
-    result = subprocess.run(
-        [
-            sys.executable,
-            "-m",
-            "check_circular_import",
-            str(clean_project),
-            "--verbose",
-        ],
-        capture_output=True,
-        text=True,
-    )
+    exit_code = main([str(clean_project), "--verbose"])
+    output = capsys.readouterr().out
 
-    assert result.returncode == 0
-    assert "Analyzing Python files in:" in result.stdout
-    assert "Ignoring directories:" in result.stdout
+    assert exit_code == 0
+    assert "Analyzing Python files in:" in output
+    assert "Ignoring directories:" in output
 
 
-def test_cli_current_directory():
+def test_cli_current_directory(capsys, monkeypatch):
     """Test CLI with current directory (default)."""
-    result = subprocess.run(
-        [sys.executable, "-m", "check_circular_import"],
-        capture_output=True,
-        text=True,
-        cwd=str(Path(__file__).parent.parent),  # Run from project root
-    )
+    monkeypatch.chdir(Path(__file__).parent.parent)  # Run from project root
+    exit_code = main([])
 
     # Should complete without crashing
-    assert result.returncode in [0, 1]
-    assert "CIRCULAR IMPORT DETECTION REPORT" in result.stdout
+    assert exit_code in [0, 1]
+    assert "CIRCULAR IMPORT DETECTION REPORT" in capsys.readouterr().out
+
+
+def test_cli_fast_with_circular_imports(capsys, project_with_circular_imports: Path):
+    """Test --fast mode exits 1 and reports the first cycle found."""
+    exit_code = main([str(project_with_circular_imports), "--fast"])
+    output = capsys.readouterr().out
+
+    assert exit_code == 1
+    assert "Circular import found" in output
+    assert "module_a" in output
+    assert "module_b" in output
+
+
+def test_cli_fast_with_clean_project(capsys, clean_project: Path):
+    """Test --fast mode exits 0 on a clean project."""
+    exit_code = main([str(clean_project), "--fast"])
+
+    assert exit_code == 0
+    assert "No circular imports detected" in capsys.readouterr().out
 
 
-def test_cli_nonexistent_directory():
+def test_cli_fast_json_output(capsys, project_with_circular_imports: Path):
+    """Test --fast --json emits the same cycle shape as plain --json."""
+    exit_code = main([str(project_with_circular_imports), "--fast", "--json"])
+
+    assert exit_code == 1
+
+    data = json.loads(capsys.readouterr().out)
+    assert "root_directory" in data
+    assert len(data["cycles"]) == 1
+
+    # One entry per member, no repeated cycle-closing element
+    cycle = data["cycles"][0]
+    assert sorted(cycle) == ["module_a", "module_b"]
+
+
+def test_cli_fast_json_clean_project(capsys, clean_project: Path):
+    """Test --fast --json emits an empty cycle list on a clean project."""
+    exit_code = main([str(clean_project), "--fast", "--json"])
+
+    assert exit_code == 0
+    assert json.loads(capsys.readouterr().out)["cycles"] == []
+
+
+def test_cli_nonexistent_directory(capsys):
     """Test CLI with non-existent directory."""
-    result = subprocess.run(
-        [sys.executable, "-m", "check_circular_import", "/nonexistent/path"],
-        capture_output=True,
-        text=True,
-    )
+    exit_code = main(["/nonexistent/path"])
 
     # Should handle gracefully
-    assert result.returncode == 0
-    assert "Total modules analyzed: 0" in result.stdout
+    assert exit_code == 0
+    assert "Total modules analyzed: 0" in capsys.readouterr().out
+
+
+def test_render_text_formats_synthetic_report():
+    """Test the text renderer in isolation with a hand-built report."""
+    from check_circular_import.__main__ import render_text
+
+    report = {
+        "root_directory": "/some/project",
+        "statistics": {
+            "total_modules": 5,
+            "total_dependencies": 7,
+            "modules_with_dependencies": 4,
+            "circular_dependencies_found": 1,
+        },
+        "cycles": [["module_a", "module_b"]],
+    }
+
+    output = render_text(report)
+
+    assert "CIRCULAR IMPORT DETECTION REPORT" in output
+    assert "Project root: /some/project" in output
+    assert "Total modules analyzed: 5" in output
+    assert "Found 1 circular import(s)" in output
+    assert "module_a" in output
+    assert "module_b (cycle completes)" not in output  # b is not the cycle start
+    assert "module_a (cycle completes)" in output
+
+
+def test_render_json_round_trips():
+    """Test that the JSON renderer emits parseable, faithful output."""
+    from check_circular_import.__main__ import render_json
+
+    report = {
+        "root_directory": "/some/project",
+        "statistics": {"total_modules": 0},
+        "cycles": [],
+    }
+
+    assert json.loads(render_json(report)) == report
@@ -10,9 +10,11 @@ from tests.test_utils import (
 )
 
 
-def test_detector_finds_simple_circular_import(project_with_circular_imports: Path):
+def test_detector_finds_simple_circular_import(
+    analyzed_project_with_circular_imports: tuple,
+):
     """Test that detector finds a simple circular import between two modules."""
-    cycles, stats = analyze_project(project_with_circular_imports)
+    cycles, stats = analyzed_project_with_circular_imports
 
     assert len(cycles) > 0
     assert stats["circular_dependencies_found"] > 0
@@ -20,28 +22,30 @@ def test_detector_finds_simple_circular_import(project_with_circular_imports: Pa
 
 
 def test_detector_finds_nested_circular_imports(
-    project_with_nested_circular_imports: Path,
+    analyzed_project_with_nested_circular_imports: tuple,
 ):
     """Test that detector finds circular imports in nested packages."""
-    cycles, stats = analyze_project(project_with_nested_circular_imports)
+    cycles, stats = analyzed_project_with_nested_circular_imports
 
     assert len(cycles) > 0
     assert stats["circular_dependencies_found"] > 0
     assert_cycles_contain_modules(cycles, ["submodule_a", "submodule_b", "submodule_c"])
 
 
-def test_detector_clean_project_no_cycles(clean_project: Path):
+def test_detector_clean_project_no_cycles(analyzed_clean_project: tuple):
     """Test that detector correctly reports no cycles in a clean project."""
-    cycles, stats = analyze_project(clean_project)
+    cycles, stats = analyzed_clean_project
 
     assert_no_cycles(cycles)
     assert stats["circular_dependencies_found"] == 0
     assert stats["total_modules"] == 3  # utils, main, app
 
 
-def test_detector_handles_relative_imports(project_with_relative_imports: Path):
+def test_detector_handles_relative_imports(
+    analyzed_project_with_relative_imports: tuple,
+):
     """Test that detector correctly handles relative imports."""
-    cycles, stats = analyze_project(project_with_relative_imports)
+    cycles, stats = analyzed_project_with_relative_imports
 
     assert len(cycles) > 0
     assert_cycles_contain_modules(cycles, ["models", "views"])
@@ -56,9 +60,9 @@ def test_detector_ignores_directories():
     assert "__pycache__" in detector.ignore_dirs  # Default ignore
 
 
-def test_detector_stats_accuracy(clean_project: Path):
+def test_detector_stats_accuracy(analyzed_clean_project: tuple):
     """Test that detector provides accurate statistics."""
-    cycles, stats = analyze_project(clean_project)
+    cycles, stats = analyzed_clean_project
 
     assert stats["total_modules"] == 3
     assert stats["modules_with_dependencies"] == 2  # main and app have dependencies
@@ -7,12 +7,17 @@ from tests.test_utils import (
     assert_cycles_contain_modules,
     assert_no_cycles,
     create_module_files,
+    strip_values,
+    write_many,
 )
 
+# Module snippets are input-free constants, so they are built (and their
+# string literals interned) once at import instead of per test call.
+# This also keeps content hashes stable for the write-dedup and AST
+# caches across repeated invocations.
 
-def test_self_import_detection(temp_project_dir: Path):
-    """Test detection of modules that import themselves."""
-    modules = {
+_SELF_IMPORT_MODULES = strip_values(
+    {
         "self_import": """
 import self_import
 
@@ -24,18 +29,10 @@ def normal_func():
     return "normal"
 """,
     }
+)
 
-    create_module_files(temp_project_dir, modules)
-    cycles, stats = analyze_project(temp_project_dir)
-
-    # Self-imports should be detected as cycles
-    assert len(cycles) >= 1
-    assert_cycles_contain_modules(cycles, ["self_import"])
-
-
-def test_try_except_imports(temp_project_dir: Path):
-    """Test handling of imports inside try/except blocks."""
-    modules = {
+_TRY_EXCEPT_MODULES = strip_values(
+    {
         "try_a": """
 try:
     import try_b
@@ -53,18 +50,10 @@ def fallback():
     return "fallback"
 """,
     }
+)
 
-    create_module_files(temp_project_dir, modules)
-    cycles, stats = analyze_project(temp_project_dir)
-
-    # Should detect cycles even in try/except
-    assert len(cycles) >= 1
-    assert_cycles_contain_modules(cycles, ["try_a", "try_b"])
-
-
-def test_dynamic_imports(temp_project_dir: Path):
-    """Test that dynamic imports (importlib) are not detected."""
-    modules = {
+_DYNAMIC_IMPORT_MODULES = strip_values(
+    {
         "dynamic_a": """
 import importlib
 import dynamic_b
@@ -84,18 +73,10 @@ def use_a():
 import dynamic_a
 """,
     }
+)
 
-    create_module_files(temp_project_dir, modules)
-    cycles, stats = analyze_project(temp_project_dir)
-
-    # Should only detect the static cycle between dynamic_a and dynamic_b
-    assert len(cycles) >= 1
-    assert_cycles_contain_modules(cycles, ["dynamic_a", "dynamic_b"])
-
-
-def test_future_imports(temp_project_dir: Path):
-    """Test handling of __future__ imports."""
-    modules = {
+_FUTURE_IMPORT_MODULES = strip_values(
+    {
         "future_a": """
 from __future__ import annotations
 import future_b
@@ -111,18 +92,10 @@ def create_type():
     return future_a.func_a()
 """,
     }
+)
 
-    create_module_files(temp_project_dir, modules)
-    cycles, stats = analyze_project(temp_project_dir)
-
-    # Should detect cycles despite __future__ imports
-    assert len(cycles) >= 1
-    assert_cycles_contain_modules(cycles, ["future_a", "future_b"])
-
-
-def test_import_with_dots_and_underscores(temp_project_dir: Path):
-    """Test modules with dots and underscores in names."""
-    modules = {
+_DOTTED_NAME_MODULES = strip_values(
+    {
         "module_with_underscore": """
 import another.module.with.dots
 """,
@@ -133,23 +106,10 @@ import module_with_underscore
         "another/module/__init__": "",
         "another/module/with/__init__": "",
     }
+)
 
-    create_module_files(temp_project_dir, modules)
-    cycles, stats = analyze_project(temp_project_dir)
-
-    assert len(cycles) >= 1
-    cycle_modules = set()
-    for cycle in cycles:
-        cycle_modules.update(cycle)
-
-    # Should handle module names correctly
-    assert any("module_with_underscore" in module for module in cycle_modules)
-    assert any("another.module.with.dots" in module for module in cycle_modules)
-
-
-def test_empty_files(temp_project_dir: Path):
-    """Test handling of empty Python files."""
-    modules = {
+_EMPTY_FILE_MODULES = strip_values(
+    {
         "empty_a": "",
         "empty_b": "",
         "imports_empty": """
@@ -161,43 +121,10 @@ def func():
     return "normal"
 """,
     }
+)
 
-    create_module_files(temp_project_dir, modules)
-    cycles, stats = analyze_project(temp_project_dir)
-
-    # Empty files shouldn't create cycles
-    assert_no_cycles(cycles)
-    assert stats["total_modules"] == 4
-
-
-def test_very_long_import_chains(temp_project_dir: Path):
-    """Test handling of very long import chains."""
-    # Create a chain of 20 modules
-    chain = [f"chain_{i:02d}" for i in range(20)]
-
-    modules = {}
-    for i, module in enumerate(chain):
-        next_module = chain[(i + 1) % len(chain)]
-        modules[module] = f"import {next_module}"
-
-    create_module_files(temp_project_dir, modules)
-    cycles, stats = analyze_project(temp_project_dir)
-
-    # Should detect the long cycle
-    assert len(cycles) >= 1
-    assert stats["circular_dependencies_found"] >= 1
-
-    # All modules should be in some cycle
-    cycle_modules = set()
-    for cycle in cycles:
-        cycle_modules.update(cycle)
-
-    assert len(cycle_modules) >= 20
-
-
-def test_import_error_handling(temp_project_dir: Path):
-    """Test that import errors don't crash the analyzer."""
-    modules = {
+_IMPORT_ERROR_MODULES = strip_values(
+    {
         "has_import_error": """
 import nonexistent_module_xyz
 import working_module
@@ -209,18 +136,10 @@ def work():
     return "working"
 """,
     }
+)
 
-    create_module_files(temp_project_dir, modules)
-    cycles, stats = analyze_project(temp_project_dir)
-
-    # Should still detect cycles despite import errors
-    assert len(cycles) >= 1
-    assert_cycles_contain_modules(cycles, ["has_import_error", "working_module"])
-
-
-def test_unicode_and_special_characters(temp_project_dir: Path):
-    """Test handling of modules with Unicode content."""
-    modules = {
+_UNICODE_MODULES = strip_values(
+    {
         "unicode_module": """
 # -*- coding: utf-8 -*-
 import other_module
@@ -235,18 +154,10 @@ def function():
     return unicode_module.función()
 """,
     }
+)
 
-    create_module_files(temp_project_dir, modules)
-    cycles, stats = analyze_project(temp_project_dir)
-
-    # Should handle Unicode without issues
-    assert len(cycles) >= 1
-    assert_cycles_contain_modules(cycles, ["unicode_module", "other_module"])
-
-
-def test_docstring_imports(temp_project_dir: Path):
-    """Test that imports in docstrings are not detected."""
-    modules = {
+_DOCSTRING_MODULES = strip_values(
+    {
         "docstring_a": '''
 """
 This module imports docstring_b.
@@ -269,18 +180,10 @@ def func_b():
     return "b"
 ''',
     }
+)
 
-    create_module_files(temp_project_dir, modules)
-    cycles, stats = analyze_project(temp_project_dir)
-
-    # Should detect the actual imports, not the ones in docstrings
-    assert len(cycles) >= 1
-    assert_cycles_contain_modules(cycles, ["docstring_a", "docstring_b"])
-
-
-def test_commented_imports(temp_project_dir: Path):
-    """Test that commented-out imports are not detected."""
-    modules = {
+_COMMENT_MODULES = strip_values(
+    {
         "comment_a": """
 # import comment_b  # This should NOT be detected
 import comment_b  # This should be detected
@@ -296,18 +199,10 @@ def func_b():
     return comment_a.func_a()
 """,
     }
+)
 
-    create_module_files(temp_project_dir, modules)
-    cycles, stats = analyze_project(temp_project_dir)
-
-    # Should detect only the real imports
-    assert len(cycles) >= 1
-    assert_cycles_contain_modules(cycles, ["comment_a", "comment_b"])
-
-
-def test_multiline_imports(temp_project_dir: Path):
-    """Test handling of multiline import statements."""
-    modules = {
+_MULTILINE_MODULES = strip_values(
+    {
         "multi_a": """
 from multi_b import (
     function_one,
@@ -331,18 +226,10 @@ def function_three():
     return use_multi_b()
 """,
     }
+)
 
-    create_module_files(temp_project_dir, modules)
-    cycles, stats = analyze_project(temp_project_dir)
-
-    # Should detect cycles with multiline imports
-    assert len(cycles) >= 1
-    assert_cycles_contain_modules(cycles, ["multi_a", "multi_b"])
-
-
-def test_import_as_with_cycles(temp_project_dir: Path):
-    """Test import as statements in circular dependencies."""
-    modules = {
+_ALIAS_MODULES = strip_values(
+    {
         "alias_x": """
 import alias_y as y_module
 from alias_z import func as z_func
@@ -363,8 +250,153 @@ def func():
     return x_mod.x_func()
 """,
     }
+)
+
+# Input-free fixture data for the long-chain test, evaluated once at
+# import instead of on every invocation (pytest-repeat, --count)
+_CHAIN_20 = [f"chain_{i:02d}" for i in range(20)]
+_CHAIN_20_FILES = [
+    (f"{module}.py", f"import {_CHAIN_20[(i + 1) % len(_CHAIN_20)]}".encode())
+    for i, module in enumerate(_CHAIN_20)
+]
+
+
+def test_self_import_detection(temp_project_dir: Path):
+    """Test detection of modules that import themselves."""
+    create_module_files(temp_project_dir, _SELF_IMPORT_MODULES)
+    cycles, stats = analyze_project(temp_project_dir)
+
+    # Self-imports should be detected as cycles
+    assert len(cycles) >= 1
+    assert_cycles_contain_modules(cycles, ["self_import"])
+
+
+def test_try_except_imports(temp_project_dir: Path):
+    """Test handling of imports inside try/except blocks."""
+    create_module_files(temp_project_dir, _TRY_EXCEPT_MODULES)
+    cycles, stats = analyze_project(temp_project_dir)
+
+    # Should detect cycles even in try/except
+    assert len(cycles) >= 1
+    assert_cycles_contain_modules(cycles, ["try_a", "try_b"])
+
+
+def test_dynamic_imports(temp_project_dir: Path):
+    """Test that dynamic imports (importlib) are not detected."""
+    create_module_files(temp_project_dir, _DYNAMIC_IMPORT_MODULES)
+    cycles, stats = analyze_project(temp_project_dir)
+
+    # Should only detect the static cycle between dynamic_a and dynamic_b
+    assert len(cycles) >= 1
+    assert_cycles_contain_modules(cycles, ["dynamic_a", "dynamic_b"])
+
+
+def test_future_imports(temp_project_dir: Path):
+    """Test handling of __future__ imports."""
+    create_module_files(temp_project_dir, _FUTURE_IMPORT_MODULES)
+    cycles, stats = analyze_project(temp_project_dir)
+
+    # Should detect cycles despite __future__ imports
+    assert len(cycles) >= 1
+    assert_cycles_contain_modules(cycles, ["future_a", "future_b"])
+
+
+def test_import_with_dots_and_underscores(temp_project_dir: Path):
+    """Test modules with dots and underscores in names."""
+    create_module_files(temp_project_dir, _DOTTED_NAME_MODULES)
+    cycles, stats = analyze_project(temp_project_dir)
+
+    assert len(cycles) >= 1
+    cycle_modules = set()
+    for cycle in cycles:
+        cycle_modules.update(cycle)
+
+    # Should handle module names correctly
+    assert any("module_with_underscore" in module for module in cycle_modules)
+    assert any("another.module.with.dots" in module for module in cycle_modules)
+
+
+def test_empty_files(temp_project_dir: Path):
+    """Test handling of empty Python files."""
+    create_module_files(temp_project_dir, _EMPTY_FILE_MODULES)
+    cycles, stats = analyze_project(temp_project_dir)
+
+    # Empty files shouldn't create cycles
+    assert_no_cycles(cycles)
+    assert stats["total_modules"] == 4
+
+
+def test_very_long_import_chains(temp_project_dir: Path):
+    """Test handling of very long import chains."""
+    # Bulk-write the precomputed chain of 20 modules
+    write_many(temp_project_dir, _CHAIN_20_FILES)
+    cycles, stats = analyze_project(temp_project_dir)
+
+    # Should detect the long cycle
+    assert len(cycles) >= 1
+    assert stats["circular_dependencies_found"] >= 1
+
+    # All modules should be in some cycle
+    cycle_modules = set()
+    for cycle in cycles:
+        cycle_modules.update(cycle)
+
+    assert len(cycle_modules) >= 20
 
-    create_module_files(temp_project_dir, modules)
+
+def test_import_error_handling(temp_project_dir: Path):
+    """Test that import errors don't crash the analyzer."""
+    create_module_files(temp_project_dir, _IMPORT_ERROR_MODULES)
+    cycles, stats = analyze_project(temp_project_dir)
+
+    # Should still detect cycles despite import errors
+    assert len(cycles) >= 1
+    assert_cycles_contain_modules(cycles, ["has_import_error", "working_module"])
+
+
+def test_unicode_and_special_characters(temp_project_dir: Path):
+    """Test handling of modules with Unicode content."""
+    create_module_files(temp_project_dir, _UNICODE_MODULES)
+    cycles, stats = analyze_project(temp_project_dir)
+
+    # Should handle Unicode without issues
+    assert len(cycles) >= 1
+    assert_cycles_contain_modules(cycles, ["unicode_module", "other_module"])
+
+
+def test_docstring_imports(temp_project_dir: Path):
+    """Test that imports in docstrings are not detected."""
+    create_module_files(temp_project_dir, _DOCSTRING_MODULES)
+    cycles, stats = analyze_project(temp_project_dir)
+
+    # Should detect the actual imports, not the ones in docstrings
+    assert len(cycles) >= 1
+    assert_cycles_contain_modules(cycles, ["docstring_a", "docstring_b"])
+
+
+def test_commented_imports(temp_project_dir: Path):
+    """Test that commented-out imports are not detected."""
+    create_module_files(temp_project_dir, _COMMENT_MODULES)
+    cycles, stats = analyze_project(temp_project_dir)
+
+    # Should detect only the real imports
+    assert len(cycles) >= 1
+    assert_cycles_contain_modules(cycles, ["comment_a", "comment_b"])
+
+
+def test_multiline_imports(temp_project_dir: Path):
+    """Test handling of multiline import statements."""
+    create_module_files(temp_project_dir, _MULTILINE_MODULES)
+    cycles, stats = analyze_project(temp_project_dir)
+
+    # Should detect cycles with multiline imports
+    assert len(cycles) >= 1
+    assert_cycles_contain_modules(cycles, ["multi_a", "multi_b"])
+
+
+def test_import_as_with_cycles(temp_project_dir: Path):
+    """Test import as statements in circular dependencies."""
+    create_module_files(temp_project_dir, _ALIAS_MODULES)
     cycles, stats = analyze_project(temp_project_dir)
 
     # Should detect cycles despite aliases